@@ -1,8 +1,9 @@
 import copy
 import logging
 import re
+import threading
 from re import Pattern
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import Optional, Dict, Any, Iterator, List, Union
 from collections.abc import Mapping
 from datetime import datetime, timezone
@@ -31,9 +32,7 @@ class ObjectUtilitiesContainer(ABC, Mapping):
             Dict[str, Optional[str]]: A dictionary representation of the instance with None fields removed.
         """
 
-        def _filter(value):
-            # Exclude None, -1, and empty strings
-            return value is not None and value != -1 and value != ""
+        _filter = ObjectUtilitiesContainer._is_set
 
         def _recursive_asdict(obj):
             if isinstance(obj, list):
@@ -51,6 +50,24 @@ class ObjectUtilitiesContainer(ABC, Mapping):
 
         return _recursive_asdict(self)
 
+    @staticmethod
+    def _is_set(value: Any) -> bool:
+        """
+        Returns:
+            bool: False for the values excluded from the dictionary representation (None, -1 and empty strings).
+        """
+        return value is not None and value != -1 and value != ""
+
+    def _set_keys(self) -> List[str]:
+        """
+        Lists the keys of the dictionary representation of the instance from the top-level fields only,
+        without converting (and deep-copying) the whole instance like `to_dict` does.
+
+        Returns:
+            List[str]: The names of the fields that are set.
+        """
+        return [f.name for f in fields(self) if self._is_set(getattr(self, f.name))]
+
     def get(self, attr: str, default: Any = None) -> Any:
         """
         Retrieves the value of the specified attribute.
@@ -87,14 +104,14 @@ class ObjectUtilitiesContainer(ABC, Mapping):
         Returns:
             str: The attribute names.
         """
-        return iter(self.to_dict())
+        return iter(self._set_keys())
 
     def __len__(self) -> int:
         """
         Returns:
             int: The number of non-None attributes.
         """
-        return len(self.to_dict())
+        return len(self._set_keys())
 
     def keys(self):
         """
@@ -102,7 +119,7 @@ class ObjectUtilitiesContainer(ABC, Mapping):
             dict_keys: A view object that displays the keys of the dictionary
         representation of the instance.
         """
-        return self.to_dict().keys()
+        return dict.fromkeys(self._set_keys()).keys()
 
 
 # ---------------------------------------------------
@@ -448,6 +465,9 @@ class PageTypes:
 class CounterCallback:
     def __init__(self) -> None:
         self.value = 0
+        self._lock = threading.Lock()
 
     def __call__(self, count):
-        self.value += count
+        # Can be called from several worker threads
+        with self._lock:
+            self.value += count
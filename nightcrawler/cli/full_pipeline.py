@@ -201,7 +201,7 @@ def handle_request(context: Context, request: lo.CrawlRequest) -> None:
                 text=x.fullDescription or "",
                 root=x.offerRoot,
                 title=x.title or "",
-                uid=lu.checksum(f"{x.url.split('?')[0]}_{x.title or ''}"),
+                uid=lu.checksum(f"{x.url.partition('?')[0]}_{x.title or ''}"),
                 platform="",
                 source="",
                 language="",
@@ -1,5 +1,6 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Callable
 from collections import Counter
 from nightcrawler.context import Context
@@ -198,16 +199,25 @@ class SerpapiExtractor(Extract):
 
         logger.debug(f"SerpAPI configs: {sources}")
 
-        # Collecting and structuring all results
+        # The sources are independent, so their SerpAPI calls are sent concurrently
+        max_workers = self.context.settings.serp_api.max_concurrent_requests
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.retrieve_response,
+                    keyword=keyword,
+                    client=client,
+                    custom_params=source["params"],
+                    offer_root=source["label"],
+                    callback=callback,
+                )
+                for source in sources
+            ]
+
+        # Collecting and structuring all results, in the order of the sources
         all_results = []
-        for source in sources:
-            response = self.retrieve_response(
-                keyword=keyword,
-                client=client,
-                custom_params=source["params"],
-                offer_root=source["label"],
-                callback=callback,
-            )
+        for source, future in zip(sources, futures):
+            response = future.result()
             structured_results = self.structure_results(
                 keyword, response, client, source["label"], max_number_of_results
             )
@@ -226,14 +236,17 @@ class SerpapiExtractor(Extract):
     def filter_product_page_urls(
         urls: list[str], marketplaces: List[Marketplace]
     ) -> list[str]:
-        accepted_urls = []
-        for url in urls:
-            # Use a generator expression instead of a list comprehension
-            if any(
-                re.match(marketplace.product_page_url_pattern, url)
-                for marketplace in marketplaces
-            ):
-                accepted_urls.append(url)
+        # Compile each marketplace pattern once, they are kept separate so that their
+        # flags and groups keep their own meaning
+        product_page_url_patterns = [
+            re.compile(marketplace.product_page_url_pattern)
+            for marketplace in marketplaces
+        ]
+        accepted_urls = [
+            url
+            for url in urls
+            if any(pattern.match(url) for pattern in product_page_url_patterns)
+        ]
 
         logger.debug(
             f"Removed {len(urls) - len(accepted_urls)}/{len(urls)} URLs that did not match the Marketplace product pattern."
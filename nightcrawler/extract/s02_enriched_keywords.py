@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
 from nightcrawler.context import Context
@@ -58,10 +59,11 @@ class KeywordEnricher(BaseStep):
         suggested_kw: List[Dict[str, Any]] = []
         related_kw: List[Dict[str, Any]] = []
 
-        suggested_kw += DataforSeoAPI(self.context).get_keyword_suggestions(
+        dataforseo = DataforSeoAPI(self.context)
+        suggested_kw += dataforseo.get_keyword_suggestions(
             keyword, location, language, number_of_keywords
         )
-        related_kw += DataforSeoAPI(self.context).get_related_keywords(
+        related_kw += dataforseo.get_related_keywords(
             keyword, location, language, number_of_keywords
         )
 
@@ -77,14 +79,23 @@ class KeywordEnricher(BaseStep):
             orient="records"
         )
 
-        urls: List[Dict[str, Any]] = []
-        for kw in agg_kw:
-            response = serpapi.retrieve_response(
-                keyword=kw["keywordEnriched"],
-                client=client,
-                offer_root=kw["offerRoot"],
-                max_number_of_results=number_of_keywords,
+        # The SerpAPI calls of the enriched keywords are independent, so they are sent concurrently
+        max_workers = self.context.settings.serp_api.max_concurrent_requests
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(
+                executor.map(
+                    lambda kw: serpapi.retrieve_response(
+                        keyword=kw["keywordEnriched"],
+                        client=client,
+                        offer_root=kw["offerRoot"],
+                        max_number_of_results=number_of_keywords,
+                    ),
+                    agg_kw,
+                )
             )
+
+        urls: List[Dict[str, Any]] = []
+        for kw, response in zip(agg_kw, responses):
             items = client.get_organic_results(response)
 
             kw_urls = [item.get("link") for item in items]
@@ -22,6 +22,18 @@ class GoogleReverseImageApi(BaseStep):
         # Controls how many pages of reverse image search results should be returned
         self._num_result_pages: int = 4
 
+        # Created on first use and shared by all the result pages
+        self._client: SerpAPI | None = None
+
+    def initiate_client(self) -> SerpAPI:
+        """
+        Initializes and returns the SerpAPI client.
+
+        Returns:
+            SerpAPI: An instance of the SerpAPI client.
+        """
+        return SerpAPI(self.context)
+
     def _run_reverse_image_search(
         self, image_url: str, page_number: int
     ) -> List[Tuple[str, str]]:
@@ -48,9 +60,9 @@ class GoogleReverseImageApi(BaseStep):
             "image_url": quote_plus(quote_plus(image_url)),
             "start": str((page_number - 1) * 10),
         }
-        response = SerpAPI(self.context).call_serpapi(
-            params, log_name="google_reverse_image"
-        )
+        if self._client is None:
+            self._client = self.initiate_client()
+        response = self._client.call_serpapi(params, log_name="google_reverse_image")
 
         response_urls: List[Tuple[str, str]] = self._extract_urls_from_response(
             response
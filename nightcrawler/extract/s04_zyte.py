@@ -1,5 +1,6 @@
 import logging
 import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Tuple, Any, Callable
 from tqdm.auto import tqdm
 
@@ -69,28 +70,65 @@ class ZyteExtractor(Extract):
             List[Dict[str, Any]]: The list of responses from ZyteAPI.
         """
         urls = [item.get("url") for item in serpapi_results.results]
-        responses = []
-
-        with tqdm(total=len(urls)) as pbar:
-            for url in urls:
-                if len(url) < 3:
-                    logger.error("Skipping invalid url '%s' !", url)
-                    responses.append({"error": True})
-                    continue
-                logger.warning("Zyte processing url %s", url)
-                try:
-                    response = client.call_api(url, api_config, callback=callback)
-                except Exception as e:
-                    logger.critical("Failed to call zyte for url %s", url)
-                    logger.debug(e, exc_info=True)
-                    response = {"error": True}
-                if not response:
-                    logger.error(f"Failed to collect product from {url}")
-                    response = {"error": True}
-                responses.append(response)
+        max_workers = self.context.settings.zyte.max_concurrent_requests
+
+        # The same url can be returned by several sources, it is only sent once to Zyte
+        unique_urls = list(dict.fromkeys(urls))
+
+        # Zyte calls are I/O bound, so they are sent concurrently; responses keep the order of the urls
+        # The progress bar is refreshed at most every 0.5s and ~0.5% of the urls, not on every response
+        with tqdm(
+            total=len(unique_urls),
+            mininterval=0.5,
+            miniters=max(1, len(unique_urls) // 200),
+        ) as pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                url: executor.submit(
+                    self._retrieve_single_response, client, url, api_config, callback
+                )
+                for url in unique_urls
+            }
+            for future in as_completed(futures.values()):
                 pbar.update(1)
+            responses = [futures[url].result() for url in urls]
         return responses
 
+    def _retrieve_single_response(
+        self,
+        client: ZyteAPI,
+        url: str,
+        api_config: Dict[str, Any],
+        callback: Callable[int, None] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Makes the API call to ZyteAPI for a single url.
+
+        Args:
+            client (ZyteAPI): The ZyteAPI client instance.
+            url (str): The url to process.
+            api_config (Dict[str, Any]): The configuration settings for the ZyteAPI.
+            callback (Callable[int, None] | None): Called with the number of API calls made.
+                It is invoked from the worker threads, which is safe with a CounterCallback
+                since it increments its value under a lock.
+
+        Returns:
+            Dict[str, Any]: The response from ZyteAPI, {"error": True} if the call failed.
+        """
+        if len(url) < 3:
+            logger.error("Skipping invalid url '%s' !", url)
+            return {"error": True}
+        logger.warning("Zyte processing url %s", url)
+        try:
+            response = client.call_api(url, api_config, callback=callback)
+        except Exception as e:
+            logger.critical("Failed to call zyte for url %s", url)
+            logger.debug(e, exc_info=True)
+            response = {"error": True}
+        if not response:
+            logger.error(f"Failed to collect product from {url}")
+            response = {"error": True}
+        return response
+
     def structure_results(
         self,
         responses: List[Dict[str, Any]],
@@ -150,6 +188,11 @@ class ZyteExtractor(Extract):
             return response["browserHtml"]
         elif "httpResponseBody" in response:
             decoded_data = base64.b64decode(response["httpResponseBody"])
+            # Most pages are utf-8, which is much cheaper to validate than running the charset detection
+            try:
+                return decoded_data.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
             detected_encoding = detect(decoded_data).get("encoding", "utf-8")
             return decoded_data.decode(detected_encoding or "utf-8", errors="replace")
         return ""
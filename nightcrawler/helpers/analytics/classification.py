@@ -233,8 +233,10 @@ def numeric_hard_report(y_true, y_pred):
 
 
 def print_analysis(test_ds, top_n, ascending):
-    for i, row in (
-        test_ds.sort_values("y_proba_diff", ascending=ascending).head(top_n).iterrows()
+    for row in (
+        test_ds.sort_values("y_proba_diff", ascending=ascending)
+        .head(top_n)
+        .to_dict(orient="records")
     ):
         print(
             f"> query_result_hash_id = {row['query_result_hash_id']} | title_text_hash_id = {row['title_text_hash_id']}"
@@ -1,5 +1,74 @@
 import pandas as pd
 
+from nightcrawler.helpers.utils_strings import compile_any_substring_pattern
+
+BLACKLIST_GERMAN = [
+    "nebenwirkung",
+    "erfahrung",
+    "gefährlich",
+    "gefahr",
+    "risiko",
+    "bewertung",
+    "bericht",
+    "warnung",
+    "symptome",
+    "kritik",
+]
+BLACKLIST_ENGLISH = [
+    "side effect",
+    "dangerous",
+    "danger",
+    "risk",
+    "report",
+    "warning",
+    "symptom",
+    "criticism",
+]
+BLACKLIST_FRENCH = [
+    "expérience",
+    "dangereux",
+    "danger",
+    "risque",
+    "rapport",
+    "avertissement",
+    "symptômes",
+    "secondaire",
+    "critique",
+]
+BLACKLIST_ITALIAN = [
+    "collateral",
+    "pericolo",
+    "rischio",
+    "recensione",
+    "rapporto",
+    "avvertimento",
+    "sintomi",
+    "critica",
+]
+
+# Built once at import, filter_keywords is called for every enriched keyword
+BLACKLIST = tuple(
+    BLACKLIST_GERMAN + BLACKLIST_ENGLISH + BLACKLIST_FRENCH + BLACKLIST_ITALIAN
+)
+BLACKLIST_PATTERN = compile_any_substring_pattern(BLACKLIST)
+
+# Columns of the records aggregated below, passing them avoids inferring them from every record
+KEYWORD_COLUMNS = [
+    "keywordEnriched",
+    "keywordVolume",
+    "keywordLocation",
+    "keywordLanguage",
+    "offerRoot",
+]
+URL_COLUMNS = [
+    "url",
+    "keywordVolume",
+    "keywordEnriched",
+    "keywordLanguage",
+    "keywordLocation",
+    "offerRoot",
+]
+
 
 def filter_keywords(keyword):
     """Filter irrelevant keywords based on a list for 4 languages
@@ -11,55 +80,7 @@ def filter_keywords(keyword):
         keyword (str)s: Return None if the keyword is blacklisted, otherwise return the keyword
     """
 
-    blacklist_german = [
-        "nebenwirkung",
-        "erfahrung",
-        "gefährlich",
-        "gefahr",
-        "risiko",
-        "bewertung",
-        "bericht",
-        "warnung",
-        "symptome",
-        "kritik",
-    ]
-    blacklist_english = [
-        "side effect",
-        "dangerous",
-        "danger",
-        "risk",
-        "report",
-        "warning",
-        "symptom",
-        "criticism",
-    ]
-    blacklist_french = [
-        "expérience",
-        "dangereux",
-        "danger",
-        "risque",
-        "rapport",
-        "avertissement",
-        "symptômes",
-        "secondaire",
-        "critique",
-    ]
-    blacklist_italian = [
-        "collateral",
-        "pericolo",
-        "rischio",
-        "recensione",
-        "rapporto",
-        "avvertimento",
-        "sintomi",
-        "critica",
-    ]
-
-    blacklist = (
-        blacklist_german + blacklist_english + blacklist_french + blacklist_italian
-    )
-
-    if not any(blacklisted_word in keyword for blacklisted_word in blacklist):
+    if BLACKLIST_PATTERN.search(keyword) is None:
         return None
     else:
         return keyword
@@ -75,7 +96,7 @@ def aggregate_keywords(keywords):
     Returns:
         df_agg: pandas dataframe with aggregated keywords and other columns preserved."""
 
-    df = pd.DataFrame(keywords)
+    df = pd.DataFrame.from_records(keywords, columns=KEYWORD_COLUMNS)
 
     # Group by 'keyword' and aggregate 'volume' using sum, keeping the first value of 'location' and 'language'
     df_agg = (
@@ -155,7 +176,7 @@ def aggregate_urls(urls):
 
     Returns:
         df_agg: pandas dataframe with aggregated urls"""
-    df = pd.DataFrame(urls)
+    df = pd.DataFrame.from_records(urls, columns=URL_COLUMNS)
     df_agg = (
         df.groupby("url")
         .agg(
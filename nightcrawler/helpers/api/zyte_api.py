@@ -33,6 +33,15 @@ class ZyteAPI(APICaller):
         self.endpoint = "https://api.zyte.com/v1/extract"
         self.auth = (os.environ["ZYTE_API_TOKEN"], "")
 
+        # Keep the connections to Zyte alive across calls, with one pooled connection per concurrent request
+        pool_size = self.context.settings.zyte.max_concurrent_requests
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size),
+        )
+
     def call_api(self, prompt, config, force_refresh=False, callback=None):
         data_hash = self._generate_hash((prompt, str(config)))
 
@@ -44,9 +53,8 @@ class ZyteAPI(APICaller):
         while attempts < self.max_retries:
             try:
                 start_time = time.time()
-                raw_response = requests.post(
+                raw_response = self.session.post(
                     self.endpoint,
-                    auth=self.auth,
                     json={
                         "url": prompt,
                         **config,
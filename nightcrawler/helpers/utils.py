@@ -9,12 +9,22 @@ from typing import Any, Dict, List, Union
 from nightcrawler.helpers import LOGGER_NAME
 
 
-from urllib.parse import urlparse, urlunparse, ParseResult, parse_qsl, urlencode, quote
+from urllib.parse import urlparse, urlunparse, ParseResult, urlsplit, urlunsplit
 import re
 import pandas as pd
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Query parameters that are only used for tracking and can be dropped from urls
+KNOWN_TRACKERS = (
+    "srsltid",
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "utm_term",
+    "utm_content",
+)
+
 
 def evaluate_not_na(value: str) -> bool:
     """
@@ -206,7 +216,8 @@ def get_value_counts_col(df, col_name):
 
 
 def display_values_list_cols_each_row(df: pd.DataFrame, list_cols: list):
-    for _, row in df.iterrows():
+    # Plain records avoid building a Series for every row
+    for row in df[list_cols].to_dict(orient="records"):
         for col in list_cols:
             print(f"{col}: {row[col]}")
         print("\n")
@@ -299,39 +310,27 @@ def clean_url(url):
 
 
 def remove_tracking_parameters(url):
+    # Most urls have no query string, there is nothing to remove from them
+    if "?" not in url:
+        return url
+
     # All query parameters are tracking parameters on ebay
     remove_all = url.startswith("https://www.ebay")
 
-    # Remove known trackers
-    known_trackers = [
-        "srsltid",
-        "utm_source",
-        "utm_medium",
-        "utm_campaign",
-        "utm_term",
-        "utm_content",
-    ]
-
-    parsed = urlparse(url)
-    queries = parse_qsl(parsed.query, keep_blank_values=True)
+    parsed = urlsplit(url)
+
+    # Remove known trackers. The raw "key=value" pairs are kept as they are, so the
+    # remaining parameters are not decoded and re-encoded.
     filtered = (
-        list(
-            (k[0], k[1])
-            for k in queries
-            if all([not k[0].startswith(y) for y in known_trackers])
-        )
+        [
+            pair
+            for pair in parsed.query.split("&")
+            if pair and not pair.partition("=")[0].startswith(KNOWN_TRACKERS)
+        ]
         if not remove_all
-        else list()
-    )
-    newurl = ParseResult(
-        scheme=parsed.scheme,
-        netloc=parsed.netloc,
-        path=parsed.path,
-        params=parsed.params,
-        query=urlencode(filtered, quote_via=quote),
-        fragment=parsed.fragment,
+        else []
     )
-    return urlunparse(newurl)
+    return urlunsplit(parsed._replace(query="&".join(filtered)))
 
 
 def filter_dict_keys(original_dict, keys_to_save):
@@ -1,12 +1,16 @@
 import yaml
 import os
+import logging
 import pandas as pd
 import json
 
 from . import utils_path
+from nightcrawler.helpers import LOGGER_NAME
 from nightcrawler.base import MetaData, PipelineResult, ProcessData
 from typing import Type
 
+logger = logging.getLogger(LOGGER_NAME)
+
 
 # io
 def create_directory(directory: str) -> None:
@@ -14,7 +18,7 @@ def create_directory(directory: str) -> None:
     if not os.path.exists(directory):
         # Create the directory
         os.makedirs(directory)
-        print("Directory created successfully!")
+        logger.info("Directory %s created", directory)
 
 
 def get_object_from_file(
@@ -157,12 +161,10 @@ def load_setting(path_settings: str, country: str, file_name: str) -> dict:
             setting = yaml.safe_load(file)
             return setting
 
-    except FileNotFoundError:
-        print(f"File not found: {path}")
+    except OSError as e:
+        logger.error("An error occurred while reading file %s: %s", path, e)
     except yaml.YAMLError as e:
-        print(f"Error parsing YAML file: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("Error parsing YAML file %s: %s", path, e)
 
 
 def save_and_load_setting(
@@ -190,8 +192,8 @@ def save_and_load_setting(
         with open(path, "w") as file:
             yaml.safe_dump(setting, file)
 
-    except Exception as e:
-        print(f"An error occurred while saving file: {e}")
+    except (OSError, yaml.YAMLError) as e:
+        logger.error("An error occurred while saving file %s: %s", path, e)
 
     # Load
     setting = load_setting(path_settings, country, file_name)
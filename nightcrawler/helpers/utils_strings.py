@@ -1,3 +1,5 @@
+import re
+
 # equals
 
 
@@ -83,3 +85,20 @@ def check_string_contains_any_substring(string: str, substrings: list[str]) -> b
         if check_string_contains_substring(string, substring):
             return True
     return False
+
+
+def compile_any_substring_pattern(substrings: list[str]) -> re.Pattern:
+    """Compile substrings into a single pattern, so that checking whether a string
+    contains any of them is one scan instead of one scan per substring.
+
+    Args:
+        substrings (list[str]): substrings to match.
+
+    Returns:
+        re.Pattern: pattern whose `search` finds any of the substrings.
+    """
+
+    if not substrings:
+        # Never matches, an empty alternation would match every string
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(substring) for substring in substrings))
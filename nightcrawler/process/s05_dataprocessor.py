@@ -1,15 +1,48 @@
 import logging
 
+from re import Pattern
 from typing import Dict, List, Any
 
 from nightcrawler.helpers import LOGGER_NAME
 from nightcrawler.helpers.utils import evaluate_not_na
+from nightcrawler.helpers.utils_strings import compile_any_substring_pattern
 from nightcrawler.context import Context
 
 from nightcrawler.base import ProcessData, PipelineResult, ExtractZyteData, BaseStep
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Substrings that characterize a product sold in CH, each feature is compiled once into a single pattern
+SWISS_LANGUAGES_PATTERN = compile_any_substring_pattern(
+    ["ch-de", "/ch/", "swiss", "/CH/", "/fr"]
+)
+SWISS_SHOPS_PATTERN = compile_any_substring_pattern(
+    [
+        "anastore",
+        "ayurveda101",
+        "biovea",
+        "bodysport",
+        "brack",
+        "brain-effect",
+        "ebay",
+        "gesund-gekauft",
+        "kanela",
+        "myfairtrade",
+        "nurnatur",
+        "nu3",
+        "plantavis",
+        "shop-apotheke",
+        "herbano",
+        "onebioshop",
+        "puravita",
+        "sembrador",
+        "vitaminexpress",
+        "wish",
+    ]
+)
+SWISS_WEB_EXTENSIONS_PATTERN = compile_any_substring_pattern([".ch", "ch."])
+SWISS_FRANCS_PATTERN = compile_any_substring_pattern(["CHF", "SFr"])
+
 
 class DataProcessor(BaseStep):
     """
@@ -50,9 +83,8 @@ class DataProcessor(BaseStep):
             currentStepResults=raw_results, pipelineResults=pipeline_result
         )
 
-        # Update pipeline_result with processed results
-        for index in range(len(zyte_results)):
-            zyte_results[index] = raw_results[index]
+        # Update pipeline_result with processed results (in place)
+        zyte_results[:] = raw_results
 
         # Filter results based on country
         if country == "CH":
@@ -79,67 +111,34 @@ class DataProcessor(BaseStep):
         Returns:
             List[ProcessData]: The processed JSON list, now with a 'result_sold_CH' key that determines if the product is sold in the Swiss market.
         """
-        languages = ["ch-de", "/ch/", "swiss", "/CH/", "/fr"]
-        shops = [
-            "anastore",
-            "ayurveda101",
-            "biovea",
-            "bodysport",
-            "brack",
-            "brain-effect",
-            "ebay",
-            "gesund-gekauft",
-            "kanela",
-            "myfairtrade",
-            "nurnatur",
-            "nu3",
-            "plantavis",
-            "shop-apotheke",
-            "herbano",
-            "onebioshop",
-            "puravita",
-            "sembrador",
-            "vitaminexpress",
-            "wish",
+        features_to_check = [
+            "ch-de_in_url",
+            "swisscompany_in_url",
+            "web_extension_in_url",
+            "francs_in_url",
         ]
-        web_extensions = [".ch", "ch."]
-        price_swiss_francs = ["CHF", "SFr"]
 
-        CH_processed_json = [
-            {
-                **url_item,
+        # Compute the features and the 'result_sold_CH' key in a single pass per item
+        CH_processed_json = []
+        for url_item in raw_json_urls:
+            features = {
                 "ch_de_in_url": DataProcessor._is_substring_in_column(
-                    url_item["url"], languages
+                    url_item["url"], SWISS_LANGUAGES_PATTERN
                 ),
                 "swisscompany_in_url": DataProcessor._is_substring_in_column(
-                    url_item["url"], shops
+                    url_item["url"], SWISS_SHOPS_PATTERN
                 ),
                 "web_extension_in_url": DataProcessor._is_substring_in_column(
-                    url_item["url"], web_extensions
+                    url_item["url"], SWISS_WEB_EXTENSIONS_PATTERN
                 ),
                 "francs_in_url": DataProcessor._is_substring_in_column(
-                    url_item.get("price", ""), price_swiss_francs
+                    url_item.get("price", ""), SWISS_FRANCS_PATTERN
                 ),
             }
-            for url_item in raw_json_urls
-        ]
-
-        # Add the 'result_sold_CH' key to each item
-        features_to_check = [
-            "ch-de_in_url",
-            "swisscompany_in_url",
-            "web_extension_in_url",
-            "francs_in_url",
-        ]
-        CH_processed_json = [
-            ProcessData(
-                **url_item,
-                result_sold_CH=DataProcessor._has_at_least_one_feature(
-                    url_item, features_to_check
-                ),
+            features["result_sold_CH"] = DataProcessor._has_at_least_one_feature(
+                features, features_to_check
             )
-            for url_item in CH_processed_json
-        ]
+            CH_processed_json.append(ProcessData(**{**url_item, **features}))
 
         return CH_processed_json
 
@@ -160,20 +159,18 @@ class DataProcessor(BaseStep):
         return any(item_json.get(feature, False) for feature in features_to_check)
 
     @staticmethod
-    def _is_substring_in_column(_input: str, substrings: List[str]) -> bool:
+    def _is_substring_in_column(_input: str, substrings_pattern: Pattern) -> bool:
         """
         Checks if any of the specified substrings are present in the given input string. Returns True if at least one substring is found; otherwise, returns False.
 
         Args:
             _input (str): The input string to search within.
-            substrings (List[str]): A list of substrings to check for within the `_input`.
+            substrings_pattern (Pattern): The substrings to check for within the `_input`, compiled with `compile_any_substring_pattern`.
 
         Returns:
-            bool: True if any substring in `substrings` is found within `_input`, False otherwise.
+            bool: True if any of the substrings is found within `_input`, False otherwise.
         """
-        return evaluate_not_na(_input) and any(
-            substring in _input for substring in substrings
-        )
+        return evaluate_not_na(_input) and substrings_pattern.search(_input) is not None
 
     def apply_step(
         self, previous_step_results: PipelineResult = None, country: str = "CH"
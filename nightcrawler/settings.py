@@ -15,10 +15,12 @@ class SerpAPISettings(BaseSettings):
 
     Attributes:
         token (str): The API token for authenticating with SerpAPI.
+        max_concurrent_requests (int): The maximum number of SerpAPI requests sent in parallel.
         model_config (SettingsConfigDict): Configuration dictionary to define environment variable prefixes.
     """
 
     token: str = os.getenv("SERP_API_TOKEN")
+    max_concurrent_requests: int = 8
     model_config: SettingsConfigDict = SettingsConfigDict(
         env_prefix="nightcrawler_serpapi_"
     )
@@ -32,12 +34,14 @@ class ZyteSettings(BaseSettings):
         url (str): The base URL for the Zyte service.
         token (str): The API token for authenticating with Zyte.
         check_interval (int): The interval (in seconds) for checking the status of jobs or tasks.
+        max_concurrent_requests (int): The maximum number of Zyte requests sent in parallel.
         model_config (SettingsConfigDict): Configuration dictionary to define environment variable prefixes.
     """
 
     url: str = ""
     token: str = os.getenv("ZYTE_API_TOKEN")
     check_interval: int = 30
+    max_concurrent_requests: int = 8
     model_config: SettingsConfigDict = SettingsConfigDict(
         env_prefix="nightcrawler_zyte_"
     )
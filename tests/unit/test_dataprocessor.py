@@ -0,0 +1,29 @@
+from nightcrawler.base import ExtractZyteData, ProcessData
+from nightcrawler.process.s05_dataprocessor import DataProcessor
+
+
+def test_add_individual_features_swiss_url():
+    raw_results = [
+        ExtractZyteData(offerRoot="GOOGLE", url="https://shop.com/ch-de/product"),
+        ExtractZyteData(offerRoot="GOOGLE", url="https://www.brack.ch/product"),
+        ExtractZyteData(offerRoot="GOOGLE", url="https://shop.com/a", price="12 CHF"),
+        ExtractZyteData(offerRoot="GOOGLE", url="https://shop.com/a"),
+    ]
+
+    results = DataProcessor._add_individual_features_swiss_url(raw_results)
+
+    assert all(isinstance(item, ProcessData) for item in results)
+    assert [item.url for item in results] == [item.url for item in raw_results]
+
+    # Each feature is computed on its own
+    assert results[0].ch_de_in_url
+    assert not results[0].swisscompany_in_url
+
+    assert results[1].swisscompany_in_url
+    assert results[1].web_extension_in_url
+    assert results[1].result_sold_CH
+
+    assert results[2].francs_in_url
+    assert results[2].result_sold_CH
+
+    assert not results[3].result_sold_CH
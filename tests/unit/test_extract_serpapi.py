@@ -3,7 +3,12 @@ import json
 from unittest.mock import MagicMock, patch, ANY
 from nightcrawler.helpers.api.serp_api import SerpAPI
 from nightcrawler.extract.s01_serp_api import SerpapiExtractor
-from nightcrawler.base import ExtractSerpapiData, PipelineResult, Organization
+from nightcrawler.base import (
+    ExtractSerpapiData,
+    PipelineResult,
+    Organization,
+    Marketplace,
+)
 
 
 @pytest.fixture
@@ -15,6 +20,7 @@ def serpapi_extractor() -> SerpapiExtractor:
     """
     context = MagicMock()
     context.settings.serp_api.token = "dummy_api_key"
+    context.settings.serp_api.max_concurrent_requests = 4
     context.serpapi_filename = "dummy_filename.json"
     context.output_dir = "/tmp"
     with open("./tests/organizations.json", "r") as file:
@@ -157,3 +163,76 @@ def test_apply_all_functions_called_once(
     )
     mock_store_results.assert_called_once()
     assert results.results == ["http://example.com"]
+
+
+@patch.object(SerpapiExtractor, "structure_results")
+@patch.object(SerpapiExtractor, "retrieve_response")
+def test_results_from_marketplaces_keeps_source_order(
+    mock_retrieve_response: MagicMock,
+    mock_structure_results: MagicMock,
+    serpapi_extractor: SerpapiExtractor,
+) -> None:
+    """
+    Test that the sources queried concurrently are structured in their definition order.
+
+    :param mock_retrieve_response: Mock for the `retrieve_response` method.
+    :param mock_structure_results: Mock for the `structure_results` method.
+    :param serpapi_extractor: Fixture that provides an instance of SerpapiExtractor.
+    """
+    mock_retrieve_response.side_effect = lambda **kwargs: kwargs["offer_root"]
+    mock_structure_results.side_effect = (
+        lambda keyword, response, client, offer_root, max_number_of_results: [
+            ExtractSerpapiData(offerRoot=offer_root, url=f"https://{response}.ch")
+        ]
+    )
+
+    results = serpapi_extractor.results_from_marketplaces(
+        MagicMock(), "aspirin", 0, callback=None
+    )
+
+    assert [result.offerRoot for result in results] == [
+        "GOOGLE",
+        "GOOGLE_SHOPPING",
+        "GOOGLE_SITE",
+        "EBAY",
+    ]
+    assert mock_retrieve_response.call_count == 4
+
+
+def test_filter_product_page_urls(serpapi_extractor: SerpapiExtractor) -> None:
+    """
+    Test that only the urls matching the product page pattern of one of the marketplaces are kept.
+
+    :param serpapi_extractor: Fixture that provides an instance of SerpapiExtractor.
+    """
+    urls = [
+        "https://www.tutti.ch/fr/vi/aspirin/123",
+        "https://www.tutti.ch/fr/li/toute-la-suisse?q=aspirin",
+        "https://other.ch/fr/vi/aspirin/123",
+    ]
+
+    marketplaces = [
+        Marketplace(
+            name="tutti",
+            root_domain_name="tutti.ch",
+            search_url_pattern="https://www.tutti.ch/fr/li/toute-la-suisse?q=%s",
+            product_page_url_pattern=r"^https://www\.tutti\.ch/fr/vi/",
+        ),
+        Marketplace(
+            name="anibis",
+            root_domain_name="anibis.ch",
+            search_url_pattern="https://www.anibis.ch/de/c/alle-kategorien?fts=%s",
+            product_page_url_pattern=r"^https://www\.anibis\.ch/de/d-",
+        ),
+    ]
+
+    accepted_urls = serpapi_extractor.filter_product_page_urls(urls, marketplaces)
+
+    assert accepted_urls == urls[:1]
+    assert serpapi_extractor.filter_product_page_urls(urls, []) == []
+
+    # Inline flags only apply to the pattern of their own marketplace
+    marketplaces[1].product_page_url_pattern = r"(?i)^https://OTHER\.ch/"
+    accepted_urls = serpapi_extractor.filter_product_page_urls(urls, marketplaces)
+
+    assert accepted_urls == [urls[0], urls[2]]
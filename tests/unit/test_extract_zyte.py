@@ -1,5 +1,7 @@
+import base64
 import pytest
 from unittest.mock import MagicMock, patch, ANY
+from nightcrawler.extract import s04_zyte
 from nightcrawler.extract.s04_zyte import ZyteExtractor
 from nightcrawler.base import PipelineResult, ExtractZyteData, MetaData
 from copy import deepcopy
@@ -81,3 +83,41 @@ def test_apply_method(
 
     # Assert that the actual result matches the expected result
     assert actual_result == expected_result
+
+
+def test_retrieve_response_keeps_url_order_and_dedupes(zyte_extractor):
+    zyte_extractor.context.settings.zyte.max_concurrent_requests = 4
+    urls = [f"http://example.com/product{i}" for i in range(10)] + ["x"]
+    urls.append(urls[0])
+    serpapi_results = PipelineResult(
+        meta=MetaData(keyword="test_keyword", numberOfResults=len(urls)),
+        results=[{"url": url} for url in urls],
+    )
+
+    client = MagicMock()
+    client.call_api.side_effect = lambda url, config, callback=None: {"url": url}
+
+    responses = zyte_extractor.retrieve_response(client, serpapi_results, {})
+
+    # Invalid urls are skipped and duplicated urls are called once
+    assert responses == (
+        [{"url": url} for url in urls[:10]] + [{"error": True}] + [{"url": urls[0]}]
+    )
+    assert client.call_api.call_count == 10
+
+
+def test_get_html_from_response_decodes_body(zyte_extractor):
+    text = "<p>Livraison en Suisse: délai de 3 à 5 jours ouvrés, coût réduit</p>"
+
+    utf8_response = {"httpResponseBody": base64.b64encode(text.encode("utf-8"))}
+    latin1_response = {"httpResponseBody": base64.b64encode(text.encode("latin-1"))}
+
+    with patch(
+        "nightcrawler.extract.s04_zyte.detect", wraps=s04_zyte.detect
+    ) as detect_mock:
+        assert zyte_extractor._get_html_from_response(utf8_response) == text
+        detect_mock.assert_not_called()
+
+        # Bodies that are not valid utf-8 fall back to the charset detection
+        assert zyte_extractor._get_html_from_response(latin1_response) == text
+        detect_mock.assert_called_once()
@@ -34,6 +34,7 @@ def test_keyword_enricher_apply():
 
     # Set up the nested settings attribute
     context.settings = MagicMock()
+    context.settings.serp_api.max_concurrent_requests = 4
     context.settings.data_for_seo = MagicMock()
     context.settings.data_for_seo.api_params = {
         "US": {"location": "United States", "language": "English"},
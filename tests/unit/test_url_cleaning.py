@@ -17,3 +17,14 @@ def test_remove_tracking():
     base = "https://www.ebay.ch/some/levels/"
     assert remove_tracking_parameters(base) == base
     assert remove_tracking_parameters(base + "?a=b&c=d") == base
+
+    # Check the remaining parameters keep their original encoding
+    base = "https://a.ch/search"
+    assert (
+        remove_tracking_parameters(base + "?q=a+b%2Fc&utm_medium=xx&flag")
+        == base + "?q=a+b%2Fc&flag"
+    )
+
+    # Urls without query string are returned as they are
+    url = "https://a.ch/some/levels/page.html#details"
+    assert remove_tracking_parameters(url) is url